@@ -126,11 +126,14 @@ async def get_fetcher(
     if access._auth.passkey is None:
         return None
 
+    def fetch_sync() -> bytes:
+        resp = access.get_torrent(torrent_entry_id)
+        resp.raise_for_status()
+        return resp.content
+
     async def fetch() -> bytes:
         # TODO: change to aiohttp
-        resp = await concurrency.to_thread(access.get_torrent, torrent_entry_id)
-        resp.raise_for_status()
-        return await concurrency.to_thread(getattr, resp, "content")
+        return await concurrency.to_thread(fetch_sync)
 
     return fetch
 
@@ -153,15 +156,6 @@ def map_file_sync(info_hashes: lt.info_hash_t, file_index: int) -> Tuple[int, in
         if version == 0:
             raise KeyError(info_hashes)
         hexdigest = info_hashes.get_best().to_bytes().hex()
-        cur = conn.cursor().execute(
-            "select file_info.id from torrent_entry inner join file_info "
-            "on torrent_entry.id = file_info.id "
-            "where torrent_entry.info_hash = ?",
-            (hexdigest,),
-        )
-        if cur.fetchone() is None:
-            _LOG.debug("map_file: no cached file_info")
-            raise KeyError(info_hashes)
         cur = conn.cursor().execute(
             "select file_info.start, file_info.stop from torrent_entry "
             "inner join file_info on torrent_entry.id = file_info.id "
@@ -169,6 +163,18 @@ def map_file_sync(info_hashes: lt.info_hash_t, file_index: int) -> Tuple[int, in
             (hexdigest, file_index),
         )
         row = cur.fetchone()
+        # Only on a miss do we need to distinguish a missing torrent from a
+        # missing file
+        if row is None:
+            cur = conn.cursor().execute(
+                "select file_info.id from torrent_entry inner join file_info "
+                "on torrent_entry.id = file_info.id "
+                "where torrent_entry.info_hash = ?",
+                (hexdigest,),
+            )
+            if cur.fetchone() is None:
+                _LOG.debug("map_file: no cached file_info")
+                raise KeyError(info_hashes)
     if row is None:
         _LOG.debug("map_file: not found")
         raise IndexError()
@@ -196,7 +202,7 @@ def get_torrent_entry_id(info_hashes: lt.info_hash_t) -> int:
             raise KeyError(info_hashes)
         cur = conn.cursor().execute(
             "select id from torrent_entry where info_hash = ? and not deleted "
-            "order by id desc",
+            "order by id desc limit 1",
             (digest.hex(),),
         )
         row = cur.fetchone()
@@ -227,19 +233,27 @@ async def access_swarm(info_hashes: lt.info_hash_t) -> ConfigureSwarm:
     return configure_swarm
 
 
+def _have_file_info(conn: sqlite3.Connection, torrent_entry_id: int) -> bool:
+    cur = conn.cursor().execute(
+        "SELECT id FROM file_info WHERE id = ?", (torrent_entry_id,)
+    )
+    return cur.fetchone() is not None
+
+
 def receive_bdecoded_info(torrent_entry_id: int, info: Dict[bytes, Any]) -> None:
-    # We expect the common case to fail to find any ids to update, so we don't
-    # bother preparing the update outside the lock
+    # We expect the common case to find file info already cached, so check
+    # that without taking the write lock
+    with read_metadata_db() as (conn, version):
+        if version != 0 and _have_file_info(conn, torrent_entry_id):
+            return
+    # Parse outside the write lock, so we don't block other writers
+    update = metadata_db.ParsedTorrentInfoUpdate(
+        info, torrent_entry_id=torrent_entry_id
+    )
     with write_metadata_db() as (conn, _):
-        cur = conn.cursor().execute(
-            "SELECT id FROM file_info WHERE id = ?", (torrent_entry_id,)
-        )
-        row = cur.fetchone()
-        if row is not None:
+        # We may have raced with another writer
+        if _have_file_info(conn, torrent_entry_id):
             return
-        update = metadata_db.ParsedTorrentInfoUpdate(
-            info, torrent_entry_id=torrent_entry_id
-        )
         update.apply(conn)
 
 